@@ -8,16 +8,20 @@ Usage: ./generate-presigned-download-url.py <bucket-name> <object-key> [options]
 """
 
 import argparse
+import functools
+import hashlib
+import json
+import os
 import sys
-from typing import Optional
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple, Optional, TextIO
+from urllib.parse import quote
 
 try:
-    import boto3
-    from botocore.exceptions import ClientError, NoCredentialsError
-except ImportError:
-    print("Error: The boto3 module is not installed")
-    print("Install it with: pip3 install boto3")
-    sys.exit(1)
+    import orjson
+except ImportError:  # Optional, speeds up --json output and cache files
+    orjson = None
 
 
 # ANSI color codes
@@ -29,44 +33,268 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+# Plain output when piped or when NO_COLOR is set (https://no-color.org),
+# decided separately for stdout and stderr
+_NO_COLOR = bool(os.environ.get('NO_COLOR'))
+_IS_TTY = sys.stdout.isatty() and not _NO_COLOR
+_IS_TTY_ERR = sys.stderr.isatty() and not _NO_COLOR
+
+_ERR_RED, _ERR_YELLOW, _ERR_NC = (Colors.RED, Colors.YELLOW, Colors.NC) if _IS_TTY_ERR else ('', '', '')
+if not _IS_TTY:
+    Colors.RED = Colors.GREEN = Colors.YELLOW = Colors.BLUE = Colors.NC = ''
+
+_out_write = sys.stdout.write
+_err_write = sys.stderr.write
+
+
 def print_error(message: str) -> None:
     """Displays an error message in red."""
-    print(f"{Colors.RED}{message}{Colors.NC}", file=sys.stderr)
+    _err_write(f"{_ERR_RED}{message}{_ERR_NC}\n")
 
 
 def print_success(message: str) -> None:
     """Displays a success message in green."""
-    print(f"{Colors.GREEN}{message}{Colors.NC}")
+    _out_write(f"{Colors.GREEN}{message}{Colors.NC}\n")
 
 
-def print_warning(message: str) -> None:
-    """Displays a warning message in yellow."""
-    print(f"{Colors.YELLOW}{message}{Colors.NC}")
+def print_warning(message: str, stderr: bool = False) -> None:
+    """Displays a warning message in yellow (on stderr to keep stdout machine-readable)."""
+    if stderr:
+        _err_write(f"{_ERR_YELLOW}{message}{_ERR_NC}\n")
+    else:
+        _out_write(f"{Colors.YELLOW}{message}{Colors.NC}\n")
 
 
 def print_info(message: str) -> None:
     """Displays an info message in blue."""
-    print(f"{Colors.BLUE}{message}{Colors.NC}")
+    _out_write(f"{Colors.BLUE}{message}{Colors.NC}\n")
+
+
+# On-disk cache for results worth keeping between runs
+_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'presign-s3'
+)
+IDENTITY_CACHE_TTL = 900  # 15 minutes
+
+# Seconds during which an identical offline signature is reused
+SIGNATURE_REUSE_WINDOW = 5
+
+
+@functools.lru_cache(maxsize=None)
+def _boto():
+    """
+    Imports boto3 on first use, so --help and argument errors stay fast.
+
+    Returns:
+        module: The boto3 module
+    """
+    try:
+        import boto3
+    except ImportError:
+        print("Error: The boto3 module is not installed")
+        print("Install it with: pip3 install boto3")
+        sys.exit(1)
+    return boto3
+
+
+@functools.lru_cache(maxsize=None)
+def _session():
+    """Returns the boto3 session shared by all clients (credentials resolved once)."""
+    return _boto().Session()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_config():
+    """Returns the shared client configuration (fail fast, keep-alive pool)."""
+    _boto()
+    from botocore.config import Config
+
+    return Config(
+        retries={'max_attempts': 2, 'mode': 'standard'},
+        connect_timeout=2,
+        read_timeout=5,
+        max_pool_connections=4,
+        tcp_keepalive=True,
+        signature_version='s3v4',
+        s3={'addressing_style': 'virtual', 'us_east_1_regional_endpoint': 'regional'}
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_s3(region: Optional[str] = None):
+    """Returns the S3 client for a region, built once and shared by all helpers."""
+    return _session().client('s3', region_name=region, config=_get_config())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sts():
+    """Returns the STS client, built once and shared by all helpers."""
+    return _session().client('sts', config=_get_config())
+
+
+def get_caller_identity() -> dict:
+    """
+    Retrieves the STS caller identity, cached on disk per access key.
+
+    Returns:
+        dict: Caller identity (Account, UserId, Arn)
+    """
+    _boto()
+    from botocore.exceptions import NoCredentialsError
+
+    credentials = _session().get_credentials()
+    if credentials is None:
+        raise NoCredentialsError()
+
+    key_hash = hashlib.sha256(credentials.access_key.encode()).hexdigest()[:16]
+    cache_path = os.path.join(_CACHE_DIR, f"{key_hash}.json")
+
+    try:
+        if os.path.getmtime(cache_path) > time.time() - IDENTITY_CACHE_TTL:
+            with open(cache_path) as f:
+                return _json_loads(f.read())
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache, ask STS
+
+    response = _get_sts().get_caller_identity()
+    identity = {
+        'Account': response['Account'],
+        'UserId': response['UserId'],
+        'Arn': response['Arn']
+    }
+
+    _write_cache_file(cache_path, _json_dumps(identity))
+    return identity
+
+
+def _json_dumps(value) -> str:
+    """Serializes a cache entry to JSON (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _json_loads(data: str):
+    """Parses a JSON cache entry (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_cache_file(cache_path: str, content: str) -> None:
+    """
+    Writes a cache file atomically, so a concurrent run never reads a partial file.
+
+    Files are only readable by the owner: cached URLs are bearer credentials.
+
+    Args:
+        cache_path: Cache file path
+        content: File content
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def _region_cache_path(bucket_name: str) -> str:
+    """Returns the file caching the region of a bucket."""
+    return os.path.join(_CACHE_DIR, 'region', f"{quote(bucket_name, safe='')}.txt")
+
+
+def _read_cached_region(bucket_name: str) -> Optional[str]:
+    """
+    Reads the region of a bucket from the on-disk cache.
+
+    Args:
+        bucket_name: S3 bucket name
+
+    Returns:
+        Optional[str]: Region name or None if unknown
+    """
+    try:
+        with open(_region_cache_path(bucket_name)) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
 
 
-def check_aws_credentials() -> bool:
+@functools.lru_cache(maxsize=None)
+def get_bucket_region(bucket_name: str) -> Optional[str]:
+    """
+    Resolves the region of a bucket, cached on disk by bucket name.
+
+    Talking to the bucket's own region avoids the redirect/retry requests
+    botocore makes when a client is pointed at the wrong one.
+
+    Args:
+        bucket_name: S3 bucket name
+
+    Returns:
+        Optional[str]: Region name or None if it cannot be determined
+    """
+    region = _read_cached_region(bucket_name)
+    if region:
+        return region
+
+    _boto()
+    from botocore.exceptions import ClientError
+
+    # S3 reports the region even when the request itself is refused
+    try:
+        response = _get_s3().head_bucket(Bucket=bucket_name)
+    except ClientError as e:
+        response = e.response
+    except Exception:
+        return None
+
+    headers = response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+    region = headers.get('x-amz-bucket-region')
+    if region:
+        _write_cache_file(_region_cache_path(bucket_name), region)
+    return region
+
+
+def print_credentials_help(stderr: bool = False) -> None:
+    """Explains how to configure missing AWS credentials."""
+    print_error("Error: AWS credentials not found")
+    print_warning("Configure your credentials with: aws configure", stderr)
+
+
+def check_aws_credentials(identity_future: Optional[Future] = None) -> bool:
     """
     Verifies that AWS credentials are configured correctly.
 
+    Args:
+        identity_future: Pending get_caller_identity call to report on
+                         (optional, the call is made here otherwise)
+
     Returns:
         bool: True if credentials are valid, False otherwise
     """
+    _boto()
+    from botocore.exceptions import ClientError, NoCredentialsError
+
     try:
-        sts_client = boto3.client('sts')
-        identity = sts_client.get_caller_identity()
-        print_success("✓ Valid AWS credentials")
-        print(f"  Account: {identity['Account']}")
-        print(f"  UserId: {identity['UserId']}")
-        print(f"  ARN: {identity['Arn']}")
+        if identity_future is not None:
+            identity = identity_future.result()
+        else:
+            identity = get_caller_identity()
+        sys.stdout.write(
+            f"{Colors.GREEN}✓ Valid AWS credentials{Colors.NC}\n"
+            f"  Account: {identity['Account']}\n"
+            f"  UserId: {identity['UserId']}\n"
+            f"  ARN: {identity['Arn']}\n"
+        )
         return True
     except NoCredentialsError:
-        print_error("Error: AWS credentials not found")
-        print_warning("Configure your credentials with: aws configure")
+        print_credentials_help()
         return False
     except ClientError as e:
         print_error(f"Error verifying credentials: {e}")
@@ -76,72 +304,193 @@ def check_aws_credentials() -> bool:
         return False
 
 
-def check_object_exists(bucket_name: str, object_key: str) -> bool:
+# (divisor, suffix, decimals) for each 1024 step, indexed by bit length
+_SIZE_UNITS = (
+    (1, 'B', 0),
+    (1024, 'KB', 2),
+    (1048576, 'MB', 2),
+    (1073741824, 'GB', 2)
+)
+
+
+def format_size(size_bytes: int) -> str:
     """
-    Checks if the object exists in the S3 bucket.
+    Converts a size in bytes to a readable format.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        str: Readable size (e.g. "1.50 MB")
+    """
+    index = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    divisor, suffix, decimals = _SIZE_UNITS[index]
+    return f"{size_bytes / divisor:.{decimals}f} {suffix}"
+
+
+class ObjectInfo(NamedTuple):
+    """Readable information about an S3 object."""
+    size: str
+    content_type: str
+    last_modified: str
+
+
+def head_object_info(
+    bucket_name: str,
+    object_key: str,
+    region: Optional[str] = None
+) -> Optional[ObjectInfo]:
+    """
+    Retrieves information about the S3 object with a single HEAD request.
 
     Args:
         bucket_name: S3 bucket name
         object_key: Object key in S3
+        region: Bucket region (optional, looked up and cached otherwise)
 
     Returns:
-        bool: True if object exists, False otherwise
+        Optional[ObjectInfo]: Object information, or None if the object does not exist
+
+    Raises:
+        Exception: Any error other than "not found" (e.g. access denied)
     """
+    _boto()
+    from botocore.exceptions import ClientError
+
     try:
-        s3_client = boto3.client('s3')
-        s3_client.head_object(Bucket=bucket_name, Key=object_key)
-        return True
+        response = _get_s3(region or get_bucket_region(bucket_name)).head_object(
+            Bucket=bucket_name,
+            Key=object_key
+        )
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
         if error_code == '404':
-            return False
-        print_warning(f"Unable to verify object existence: {e}")
-        return True  # Continue anyway
-    except Exception:
-        return True  # Continue on error
+            return None
+        raise
+
+    return ObjectInfo(
+        size=format_size(response.get('ContentLength', 0)),
+        content_type=response.get('ContentType', 'unknown'),
+        last_modified=str(response.get('LastModified', 'unknown'))
+    )
 
 
-def get_object_info(bucket_name: str, object_key: str) -> Optional[dict]:
+@functools.lru_cache(maxsize=None)
+def _get_signing_context() -> tuple:
     """
-    Retrieves information about the S3 object.
+    Resolves the credentials and region used to sign URLs offline.
+
+    Returns:
+        tuple: Frozen credentials and region name
+    """
+    _boto()
+    from botocore.exceptions import NoCredentialsError
+
+    session = _session()
+    credentials = session.get_credentials()
+    if credentials is None:
+        raise NoCredentialsError()
+    return credentials.get_frozen_credentials(), session.region_name or 'us-east-1'
+
+
+def sign_download_url_offline(
+    bucket_name: str,
+    object_key: str,
+    expiration: int = 3600,
+    response_content_disposition: Optional[str] = None,
+    region: Optional[str] = None
+) -> str:
+    """
+    Signs a GET URL locally with SigV4, without going through an S3 client.
+
+    The URL is signed for the given region, else for the bucket's region,
+    looked up once per bucket and then cached on disk, so only the first
+    run for a bucket does any network I/O.
+
+    The same request signed again within SIGNATURE_REUSE_WINDOW seconds
+    reuses the previous URL (e.g. repeated keys in --batch).
 
     Args:
         bucket_name: S3 bucket name
-        object_key: Object key in S3
+        object_key: Object key/path in S3
+        expiration: Validity duration in seconds (default: 3600)
+        response_content_disposition: Content-Disposition override (optional)
+        region: Bucket region (optional, looked up and cached otherwise)
 
     Returns:
-        Optional[dict]: Object information or None
+        str: Presigned URL
     """
-    try:
-        s3_client = boto3.client('s3')
-        response = s3_client.head_object(Bucket=bucket_name, Key=object_key)
-
-        size_bytes = response.get('ContentLength', 0)
-
-        # Convert to readable format
-        if size_bytes < 1024:
-            size_str = f"{size_bytes} B"
-        elif size_bytes < 1048576:
-            size_str = f"{size_bytes / 1024:.2f} KB"
-        elif size_bytes < 1073741824:
-            size_str = f"{size_bytes / 1048576:.2f} MB"
-        else:
-            size_str = f"{size_bytes / 1073741824:.2f} GB"
+    return _sign_download_url(
+        bucket_name,
+        object_key,
+        expiration,
+        response_content_disposition,
+        region,
+        int(time.time()) // SIGNATURE_REUSE_WINDOW
+    )
 
-        return {
-            'size': size_str,
-            'content_type': response.get('ContentType', 'unknown'),
-            'last_modified': response.get('LastModified', 'unknown')
-        }
-    except Exception:
-        return None
+
+@functools.lru_cache(maxsize=4096)
+def _sign_download_url(
+    bucket_name: str,
+    object_key: str,
+    expiration: int,
+    response_content_disposition: Optional[str],
+    region: Optional[str],
+    time_window: int
+) -> str:
+    """Signs a GET URL; time_window only scopes the cache entry."""
+    _boto()
+    from botocore.auth import S3SigV4QueryAuth
+    from botocore.awsrequest import AWSRequest
+
+    credentials, default_region = _get_signing_context()
+    region = region or get_bucket_region(bucket_name) or default_region
+
+    # Dotted bucket names don't match the wildcard TLS certificate
+    path = quote(object_key, safe='/~')
+    if '.' in bucket_name:
+        url = f"https://s3.{region}.amazonaws.com/{bucket_name}/{path}"
+    else:
+        url = f"https://{bucket_name}.s3.{region}.amazonaws.com/{path}"
+
+    params = {}
+    if response_content_disposition:
+        params['response-content-disposition'] = response_content_disposition
+
+    request = AWSRequest(method='GET', url=url, params=params)
+    S3SigV4QueryAuth(credentials, 's3', region, expires=expiration).add_auth(request)
+    return request.url
+
+
+@functools.lru_cache(maxsize=1024)
+def content_disposition(filename: str) -> str:
+    """
+    Builds an attachment Content-Disposition for a suggested filename.
+
+    Follows RFC 6266: a quoted ASCII filename for clients that ignore
+    filename* (e.g. curl -OJ), non-ASCII characters replaced with "_",
+    then the exact name in RFC 5987 encoding for the others.
+
+    Args:
+        filename: Suggested filename for download
+
+    Returns:
+        str: Content-Disposition header value
+    """
+    fallback = ''.join(char if ' ' <= char <= '~' else '_' for char in filename)
+    fallback = fallback.replace('\\', '\\\\').replace('"', '\\"')
+    encoded = quote(filename, safe='')
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{encoded}"
 
 
 def generate_presigned_download_url(
     bucket_name: str,
     object_key: str,
     expiration: int = 3600,
-    filename: Optional[str] = None
+    filename: Optional[str] = None,
+    offline: bool = False,
+    region: Optional[str] = None
 ) -> Optional[str]:
     """
     Generates a presigned URL to download an object from S3.
@@ -151,13 +500,16 @@ def generate_presigned_download_url(
         object_key: Object key/path in S3
         expiration: Validity duration in seconds (default: 3600)
         filename: Suggested filename for download (optional)
+        offline: Sign locally without building an S3 client (default: False)
+        region: Bucket region (optional, looked up and cached otherwise)
 
     Returns:
         Optional[str]: Presigned URL or None on error
     """
-    try:
-        s3_client = boto3.client('s3')
+    _boto()
+    from botocore.exceptions import ClientError, NoCredentialsError
 
+    try:
         # Prepare parameters
         params = {
             'Bucket': bucket_name,
@@ -167,11 +519,20 @@ def generate_presigned_download_url(
         # Add suggested filename if specified
         response_content_disposition = None
         if filename:
-            response_content_disposition = f'attachment; filename="{filename}"'
+            response_content_disposition = content_disposition(filename)
             params['ResponseContentDisposition'] = response_content_disposition
 
+        if offline:
+            return sign_download_url_offline(
+                bucket_name,
+                object_key,
+                expiration,
+                response_content_disposition,
+                region
+            )
+
         # Generate presigned URL for GET
-        presigned_url = s3_client.generate_presigned_url(
+        presigned_url = _get_s3(region or get_bucket_region(bucket_name)).generate_presigned_url(
             'get_object',
             Params=params,
             ExpiresIn=expiration
@@ -179,6 +540,9 @@ def generate_presigned_download_url(
 
         return presigned_url
 
+    except NoCredentialsError:
+        print_credentials_help()
+        return None
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
         error_message = e.response.get('Error', {}).get('Message', str(e))
@@ -189,44 +553,118 @@ def generate_presigned_download_url(
         return None
 
 
-def print_usage_examples(presigned_url: str, expiration: int, object_key: str) -> None:
+def _json_line(record: dict) -> bytes:
+    """Encodes a record as one compact UTF-8 JSON line (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode() + b'\n'
+
+
+def generate_batch_urls(
+    lines: TextIO,
+    expiration: int = 3600,
+    filename: Optional[str] = None,
+    as_json: bool = False,
+    region: Optional[str] = None
+) -> bool:
     """
-    Displays usage examples for the presigned URL.
+    Signs one download URL per "bucket<TAB>key[<TAB>filename]" input line.
+
+    URLs are signed offline and written as bytes to stdout in input order,
+    with a single flush at the end. Invalid lines are reported on stderr.
 
     Args:
-        presigned_url: The generated presigned URL
-        expiration: Validity duration in seconds
-        object_key: Object key
+        lines: Input lines (e.g. sys.stdin)
+        expiration: Validity duration in seconds (default: 3600)
+        filename: Suggested filename when a line doesn't provide one (optional)
+        as_json: Write {"bucket", "key", "url"} JSON lines instead of bare URLs
+        region: Region of every bucket (optional, looked up once per bucket otherwise)
+
+    Returns:
+        bool: True if every line was signed, False otherwise
     """
-    print()
-    print("━" * 70)
-    print_success("PRESIGNED DOWNLOAD URL:")
-    print(presigned_url)
-    print("━" * 70)
-    print()
-
-    print_warning("To download the file with this URL:")
-    print()
-    print("  With the provided script:")
-    print(f'  ./download-from-presigned-url.sh "{presigned_url}"')
-    print()
-    print("  With curl:")
-    print(f'  curl -o "file" "{presigned_url}"')
-    print()
-    print("  With wget:")
-    print(f'  wget -O "file" "{presigned_url}"')
-    print()
-    print("  In a web browser:")
-    print("  Simply paste the URL in the address bar")
-    print()
-    print("  With Python requests:")
-    print("  import requests")
-    print(f"  response = requests.get('{presigned_url[:50]}...')")
-    print("  with open('file', 'wb') as f:")
-    print("      f.write(response.content)")
-    print()
-
-    # Convert duration to readable format
+    _boto()
+    from botocore.exceptions import NoCredentialsError
+
+    # Missing credentials fail every line the same way: report them once
+    try:
+        _get_signing_context()
+    except NoCredentialsError:
+        print_credentials_help(stderr=True)
+        return False
+
+    # Bypass the text layer, presigned URLs are plain ASCII
+    sys.stdout.flush()
+    write = sys.stdout.buffer.write
+    success = True
+
+    for line_number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        if not line.strip():
+            continue
+
+        fields = line.split('\t')
+        if len(fields) not in (2, 3) or not fields[0] or not fields[1]:
+            print_error(f"Line {line_number}: expected bucket<TAB>key[<TAB>filename]")
+            success = False
+            continue
+
+        # Bucket names are ASCII; the URL is written as ASCII bytes below
+        if any(ord(char) > 127 for char in fields[0]):
+            print_error(f"Line {line_number}: invalid bucket name '{fields[0]}'")
+            success = False
+            continue
+
+        presigned_url = generate_presigned_download_url(
+            fields[0],
+            fields[1],
+            expiration,
+            fields[2] if len(fields) == 3 else filename,
+            offline=True,
+            region=region
+        )
+        if not presigned_url:
+            print_error(f"Line {line_number}: failed to generate presigned URL")
+            success = False
+            continue
+
+        if as_json:
+            write(_json_line({'bucket': fields[0], 'key': fields[1], 'url': presigned_url}))
+        else:
+            write(presigned_url.encode('ascii') + b'\n')
+
+    sys.stdout.buffer.flush()
+    return success
+
+
+# Readable form of the most common expirations
+_COMMON_DURATIONS = {
+    300: "5 minutes",
+    600: "10 minutes",
+    900: "15 minutes",
+    1800: "30 minutes",
+    3600: "1 hour",
+    7200: "2 hours",
+    86400: "24 hours",
+    604800: "168 hours"
+}
+
+
+@functools.lru_cache(maxsize=128)
+def format_duration(expiration: int) -> str:
+    """
+    Converts a duration in seconds to a readable format.
+
+    Args:
+        expiration: Duration in seconds
+
+    Returns:
+        str: Readable duration (e.g. "1 hour 30 minutes")
+    """
+    common = _COMMON_DURATIONS.get(expiration)
+    if common:
+        return common
+
     hours = expiration // 3600
     minutes = (expiration % 3600) // 60
     seconds = expiration % 60
@@ -239,39 +677,119 @@ def print_usage_examples(presigned_url: str, expiration: int, object_key: str) -
     if seconds > 0 or not duration_parts:
         duration_parts.append(f"{seconds} second{'s' if seconds > 1 else ''}")
 
-    duration_str = " ".join(duration_parts)
-    print_warning(f"The URL expires in {duration_str}")
-    print()
+    return " ".join(duration_parts)
 
 
-def main():
-    """Main script function."""
-    parser = argparse.ArgumentParser(
-        description="Generates an AWS S3 presigned URL for file download",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def print_usage_examples(presigned_url: str, expiration: int, object_key: str) -> None:
+    """
+    Displays usage examples for the presigned URL.
+
+    Args:
+        presigned_url: The generated presigned URL
+        expiration: Validity duration in seconds
+        object_key: Object key
+    """
+    # Build the whole block first and write it in one call
+    out = []
+    out.append("\n")
+    out.append("━" * 70 + "\n")
+    out.append(f"{Colors.GREEN}PRESIGNED DOWNLOAD URL:{Colors.NC}\n")
+    out.append(f"{presigned_url}\n")
+    out.append("━" * 70 + "\n")
+    out.append("\n")
+
+    out.append(f"{Colors.YELLOW}To download the file with this URL:{Colors.NC}\n")
+    out.append("\n")
+    out.append("  With the provided script:\n")
+    out.append(f'  ./download-from-presigned-url.sh "{presigned_url}"\n')
+    out.append("\n")
+    out.append("  With curl:\n")
+    out.append(f'  curl -o "file" "{presigned_url}"\n')
+    out.append("\n")
+    out.append("  With wget:\n")
+    out.append(f'  wget -O "file" "{presigned_url}"\n')
+    out.append("\n")
+    out.append("  In a web browser:\n")
+    out.append("  Simply paste the URL in the address bar\n")
+    out.append("\n")
+    out.append("  With Python requests:\n")
+    out.append("  import requests\n")
+    out.append(f"  response = requests.get('{presigned_url[:50]}...')\n")
+    out.append("  with open('file', 'wb') as f:\n")
+    out.append("      f.write(response.content)\n")
+    out.append("\n")
+
+    out.append(f"{Colors.YELLOW}The URL expires in {format_duration(expiration)}{Colors.NC}\n")
+    out.append("\n")
+
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
+
+
+def _validate(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Validates the parsed arguments, exiting on error.
+
+    Runs before anything imports boto3, so typos fail immediately.
+
+    Args:
+        parser: Argument parser (for usage errors)
+        args: Parsed arguments
+    """
+    if args.batch:
+        if args.bucket_name or args.object_key:
+            parser.error("bucket_name and object_key are read from stdin with --batch")
+    elif not args.bucket_name or not args.object_key:
+        parser.error("bucket_name and object_key are required")
+    elif args.json:
+        parser.error("--json requires --batch")
+
+    if args.expiration < 1:
+        print_error("Error: Expiration must be at least 1 second")
+        sys.exit(1)
+
+    if args.expiration > 604800:  # 7 days
+        # Batch output is parsed line by line (--json): keep it clean
+        print_warning(
+            "Warning: Maximum recommended expiration is 7 days (604800 seconds)",
+            stderr=args.batch
+        )
+
+
+HELP_EPILOG = """
 Examples:
   %(prog)s my-bucket uploads/document.pdf
   %(prog)s my-bucket uploads/document.pdf --expiration 7200
   %(prog)s my-bucket uploads/photo.jpg --filename "my-photo.jpg"
   %(prog)s my-bucket data/report.xlsx --expiration 300 --filename "report-2025.xlsx"
+  printf 'my-bucket\\ta.pdf\\nmy-bucket\\tb.pdf\\n' | %(prog)s --batch
 
 Prerequisites:
   - Python 3 with boto3 installed (pip3 install boto3)
   - Configured AWS credentials (aws configure)
   - S3 permissions to generate presigned URLs (s3:GetObject)
   - The file must exist in the S3 bucket
-        """
+"""
+
+
+def main():
+    """Main script function."""
+    parser = argparse.ArgumentParser(
+        description="Generates an AWS S3 presigned URL for file download",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=HELP_EPILOG
     )
 
     parser.add_argument(
         'bucket_name',
-        help='S3 bucket name (required)'
+        nargs='?',
+        help='S3 bucket name (required unless --batch)'
     )
 
     parser.add_argument(
         'object_key',
-        help='Object key/path in S3 (required)'
+        nargs='?',
+        help='Object key/path in S3 (required unless --batch)'
     )
 
     parser.add_argument(
@@ -287,6 +805,12 @@ Prerequisites:
         default=None
     )
 
+    parser.add_argument(
+        '--region', '-r',
+        help='Bucket region (default: $AWS_REGION, or detected once and cached)',
+        default=os.environ.get('AWS_REGION')
+    )
+
     parser.add_argument(
         '--quiet', '-q',
         action='store_true',
@@ -299,25 +823,74 @@ Prerequisites:
         help='Do not check if the file exists (faster)'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--verify-credentials', '--verify-creds',
+        action='store_true',
+        help='Verify AWS credentials with STS and display the caller identity'
+    )
 
-    # Validate arguments
-    if args.expiration < 1:
-        print_error("Error: Expiration must be at least 1 second")
-        sys.exit(1)
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Sign the URL locally without building an S3 client (faster)'
+    )
 
-    if args.expiration > 604800:  # 7 days
-        print_warning("Warning: Maximum recommended expiration is 7 days (604800 seconds)")
+    parser.add_argument(
+        '--batch', '-b',
+        action='store_true',
+        help='Read "bucket<TAB>key[<TAB>filename]" lines from stdin and print one URL per line'
+    )
 
-    if not args.quiet:
-        print_warning("Checking prerequisites...")
-        print()
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='With --batch, print {"bucket", "key", "url"} JSON lines'
+    )
 
-        # Check AWS credentials
-        if not check_aws_credentials():
+    args = parser.parse_args()
+    _validate(parser, args)
+
+    # Batch mode: sign every stdin line in this process
+    if args.batch:
+        if not generate_batch_urls(
+            sys.stdin,
+            args.expiration,
+            args.filename,
+            args.json,
+            args.region
+        ):
             sys.exit(1)
+        return
+
+    if not args.quiet:
+        _boto()
+        from botocore.exceptions import NoCredentialsError
+
+        # Start the STS and HEAD round-trips concurrently, report in order.
+        # boto3 sessions are not thread-safe, so build the clients up front.
+        # Without --verify-credentials, the HEAD/signing calls surface
+        # credential problems themselves, no STS round-trip needed.
+        _get_s3(args.region or get_bucket_region(args.bucket_name))
+        executor = ThreadPoolExecutor(max_workers=2)
+        identity_future = None
+        if args.verify_credentials:
+            _get_sts()
+            identity_future = executor.submit(get_caller_identity)
+        info_future = None
+        if not args.no_check:
+            info_future = executor.submit(
+                head_object_info, args.bucket_name, args.object_key, args.region
+            )
+        executor.shutdown(wait=False)
+
+        # Check AWS credentials (if requested)
+        if identity_future is not None:
+            print_warning("Checking prerequisites...")
+            print()
+            if not check_aws_credentials(identity_future):
+                sys.exit(1)
+            print()
 
-        print()
         print_warning("Generating presigned download URL...")
         print(f"Bucket: {args.bucket_name}")
         print(f"Object Key: {args.object_key}")
@@ -327,28 +900,40 @@ Prerequisites:
         print()
 
         # Check if object exists (if not disabled)
-        if not args.no_check:
+        if info_future is not None:
             print_info("Checking file existence...")
-            if not check_object_exists(args.bucket_name, args.object_key):
-                print_error(f"The file '{args.object_key}' does not exist in bucket '{args.bucket_name}'")
-                print_warning("Use --no-check to skip this verification")
+            try:
+                info = info_future.result()
+            except NoCredentialsError:
+                print_credentials_help()
                 sys.exit(1)
-
-            # Display file information
-            info = get_object_info(args.bucket_name, args.object_key)
-            if info:
+            except Exception as e:
+                print_warning(f"Unable to verify object existence: {e}")  # Continue anyway
+            else:
+                if info is None:
+                    print_error(f"The file '{args.object_key}' does not exist in bucket '{args.bucket_name}'")
+                    print_warning("Use --no-check to skip this verification")
+                    sys.exit(1)
+
+                # Display file information
                 print_success("✓ File found")
-                print(f"  Size: {info['size']}")
-                print(f"  Type: {info['content_type']}")
-                print(f"  Last modified: {info['last_modified']}")
+                print(f"  Size: {info.size}")
+                print(f"  Type: {info.content_type}")
+                print(f"  Last modified: {info.last_modified}")
             print()
 
+    # Nothing to check in quiet mode with --no-check: sign locally, with no
+    # network I/O once the bucket region is known
+    offline = args.offline or (args.quiet and args.no_check)
+
     # Generate presigned URL
     presigned_url = generate_presigned_download_url(
         args.bucket_name,
         args.object_key,
         args.expiration,
-        args.filename
+        args.filename,
+        offline,
+        args.region
     )
 
     if not presigned_url:
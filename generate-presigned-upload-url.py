@@ -8,17 +8,22 @@ Usage: ./generate-presigned-upload-url.py <bucket-name> [options]
 """
 
 import argparse
+import functools
+import hashlib
+import hmac
+import json
+import os
+import re
 import sys
-from datetime import datetime
-from typing import Optional
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, NamedTuple, Optional, TextIO
+from urllib.parse import quote
 
 try:
-    import boto3
-    from botocore.exceptions import ClientError, NoCredentialsError
-except ImportError:
-    print("Error: The boto3 module is not installed")
-    print("Install it with: pip3 install boto3")
-    sys.exit(1)
+    import orjson
+except ImportError:  # Optional, speeds up cache files
+    orjson = None
 
 
 # ANSI color codes
@@ -30,24 +35,304 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+# Plain output when piped or when NO_COLOR is set (https://no-color.org),
+# decided separately for stdout and stderr
+_NO_COLOR = bool(os.environ.get('NO_COLOR'))
+_IS_TTY = sys.stdout.isatty() and not _NO_COLOR
+_IS_TTY_ERR = sys.stderr.isatty() and not _NO_COLOR
+
+_ERR_RED, _ERR_YELLOW, _ERR_NC = (Colors.RED, Colors.YELLOW, Colors.NC) if _IS_TTY_ERR else ('', '', '')
+if not _IS_TTY:
+    Colors.RED = Colors.GREEN = Colors.YELLOW = Colors.BLUE = Colors.NC = ''
+
+_out_write = sys.stdout.write
+_err_write = sys.stderr.write
+
+
 def print_error(message: str) -> None:
     """Displays an error message in red."""
-    print(f"{Colors.RED}{message}{Colors.NC}", file=sys.stderr)
+    _err_write(f"{_ERR_RED}{message}{_ERR_NC}\n")
 
 
 def print_success(message: str) -> None:
     """Displays a success message in green."""
-    print(f"{Colors.GREEN}{message}{Colors.NC}")
+    _out_write(f"{Colors.GREEN}{message}{Colors.NC}\n")
 
 
-def print_warning(message: str) -> None:
-    """Displays a warning message in yellow."""
-    print(f"{Colors.YELLOW}{message}{Colors.NC}")
+def print_warning(message: str, stderr: bool = False) -> None:
+    """Displays a warning message in yellow (on stderr to keep stdout machine-readable)."""
+    if stderr:
+        _err_write(f"{_ERR_YELLOW}{message}{_ERR_NC}\n")
+    else:
+        _out_write(f"{Colors.YELLOW}{message}{Colors.NC}\n")
 
 
 def print_info(message: str) -> None:
     """Displays an info message in blue."""
-    print(f"{Colors.BLUE}{message}{Colors.NC}")
+    _out_write(f"{Colors.BLUE}{message}{Colors.NC}\n")
+
+
+# On-disk cache for results worth keeping between runs
+_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'presign-s3'
+)
+IDENTITY_CACHE_TTL = 900  # 15 minutes
+URL_CACHE_MIN_REMAINING = 300  # Never hand out a cached URL about to expire
+URL_CACHE_PREFIX = 'presign-'
+_URL_CACHE_FILE = re.compile(rf'{URL_CACHE_PREFIX}[0-9a-f]{{32}}\.json\Z')
+
+
+@functools.lru_cache(maxsize=None)
+def _boto():
+    """
+    Imports boto3 on first use, so --help and argument errors stay fast.
+
+    Returns:
+        module: The boto3 module
+    """
+    try:
+        import boto3
+    except ImportError:
+        print("Error: The boto3 module is not installed")
+        print("Install it with: pip3 install boto3")
+        sys.exit(1)
+    return boto3
+
+
+@functools.lru_cache(maxsize=None)
+def _session():
+    """Returns the boto3 session shared by all clients (credentials resolved once)."""
+    return _boto().Session()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_config():
+    """Returns the shared client configuration (fail fast, keep-alive pool)."""
+    _boto()
+    from botocore.config import Config
+
+    return Config(
+        retries={'max_attempts': 2, 'mode': 'standard'},
+        connect_timeout=2,
+        read_timeout=5,
+        max_pool_connections=4,
+        tcp_keepalive=True,
+        signature_version='s3v4',
+        s3={'addressing_style': 'virtual', 'us_east_1_regional_endpoint': 'regional'}
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_s3(region: Optional[str] = None):
+    """Returns the S3 client for a region, built once and shared by all helpers."""
+    return _session().client('s3', region_name=region, config=_get_config())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sts():
+    """Returns the STS client, built once and shared by all helpers."""
+    return _session().client('sts', config=_get_config())
+
+
+def get_caller_identity() -> dict:
+    """
+    Retrieves the STS caller identity, cached on disk per access key.
+
+    Returns:
+        dict: Caller identity (Account, UserId, Arn)
+    """
+    _boto()
+    from botocore.exceptions import NoCredentialsError
+
+    credentials = _session().get_credentials()
+    if credentials is None:
+        raise NoCredentialsError()
+
+    key_hash = hashlib.sha256(credentials.access_key.encode()).hexdigest()[:16]
+    cache_path = os.path.join(_CACHE_DIR, f"{key_hash}.json")
+
+    try:
+        if os.path.getmtime(cache_path) > time.time() - IDENTITY_CACHE_TTL:
+            with open(cache_path) as f:
+                return _json_loads(f.read())
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache, ask STS
+
+    response = _get_sts().get_caller_identity()
+    identity = {
+        'Account': response['Account'],
+        'UserId': response['UserId'],
+        'Arn': response['Arn']
+    }
+
+    _write_cache_file(cache_path, _json_dumps(identity))
+    return identity
+
+
+def _json_dumps(value) -> str:
+    """Serializes a cache entry to JSON (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _json_loads(data: str):
+    """Parses a JSON cache entry (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_cache_file(cache_path: str, content: str) -> None:
+    """
+    Writes a cache file atomically, so a concurrent run never reads a partial file.
+
+    Files are only readable by the owner: cached URLs are bearer credentials.
+
+    Args:
+        cache_path: Cache file path
+        content: File content
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+class PresignedUrl(NamedTuple):
+    """A presigned URL and when it stops working."""
+    url: str
+    expires_at: int  # Epoch seconds
+    cached: bool  # Reused from the URL cache rather than signed now
+
+
+def _url_cache_path(cache_dir: str, *parts: str) -> str:
+    """Returns the file caching the presigned URL identified by parts."""
+    digest = hashlib.blake2b('\0'.join(parts).encode(), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{URL_CACHE_PREFIX}{digest}.json")
+
+
+def _read_cached_url(cache_path: str, valid_until: float) -> Optional[PresignedUrl]:
+    """
+    Reads a cached presigned URL if it stays valid long enough.
+
+    Args:
+        cache_path: Cache file path
+        valid_until: Epoch time the URL must still be valid at
+
+    Returns:
+        Optional[PresignedUrl]: Cached URL or None if missing or expiring too soon
+    """
+    try:
+        with open(cache_path) as f:
+            entry = _json_loads(f.read())
+        if entry['expires_at'] > valid_until:
+            return PresignedUrl(entry['url'], int(entry['expires_at']), True)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing or unreadable cache, sign again
+    return None
+
+
+def _write_cached_url(cache_path: str, presigned_url: PresignedUrl) -> None:
+    """
+    Caches a presigned URL, its file dated to its expiry for pruning.
+
+    Args:
+        cache_path: Cache file path
+        presigned_url: The presigned URL and its expiry
+    """
+    _write_cache_file(
+        cache_path,
+        _json_dumps({'url': presigned_url.url, 'expires_at': presigned_url.expires_at})
+    )
+    try:
+        os.utime(cache_path, (presigned_url.expires_at, presigned_url.expires_at))
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def _prune_url_cache(cache_dir: str, now: float) -> None:
+    """
+    Deletes the cached URLs that have expired (file dated before now).
+
+    Only files named like _url_cache_path() entries are considered, the
+    directory may hold anything else.
+
+    Args:
+        cache_dir: Presigned URL cache directory
+        now: Current epoch time
+    """
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if _URL_CACHE_FILE.match(entry.name) and entry.stat().st_mtime < now:
+                    os.unlink(entry.path)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def _region_cache_path(bucket_name: str) -> str:
+    """Returns the file caching the region of a bucket."""
+    return os.path.join(_CACHE_DIR, 'region', f"{quote(bucket_name, safe='')}.txt")
+
+
+def _read_cached_region(bucket_name: str) -> Optional[str]:
+    """
+    Reads the region of a bucket from the on-disk cache.
+
+    Args:
+        bucket_name: S3 bucket name
+
+    Returns:
+        Optional[str]: Region name or None if unknown
+    """
+    try:
+        with open(_region_cache_path(bucket_name)) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_bucket_region(bucket_name: str) -> Optional[str]:
+    """
+    Resolves the region of a bucket, cached on disk by bucket name.
+
+    Signing for the bucket's own region avoids any region lookup or
+    redirect when the URL is used.
+
+    Args:
+        bucket_name: S3 bucket name
+
+    Returns:
+        Optional[str]: Region name or None if it cannot be determined
+    """
+    region = _read_cached_region(bucket_name)
+    if region:
+        return region
+
+    _boto()
+    from botocore.exceptions import ClientError
+
+    # S3 reports the region even when the request itself is refused
+    try:
+        response = _get_s3().head_bucket(Bucket=bucket_name)
+    except ClientError as e:
+        response = e.response
+    except Exception:
+        return None
+
+    headers = response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+    region = headers.get('x-amz-bucket-region')
+    if region:
+        _write_cache_file(_region_cache_path(bucket_name), region)
+    return region
 
 
 def check_aws_credentials() -> bool:
@@ -57,9 +342,11 @@ def check_aws_credentials() -> bool:
     Returns:
         bool: True if credentials are valid, False otherwise
     """
+    _boto()
+    from botocore.exceptions import ClientError, NoCredentialsError
+
     try:
-        sts_client = boto3.client('sts')
-        identity = sts_client.get_caller_identity()
+        identity = get_caller_identity()
         print_success("✓ Valid AWS credentials")
         print(f"  Account: {identity['Account']}")
         print(f"  UserId: {identity['UserId']}")
@@ -79,12 +366,12 @@ def check_aws_credentials() -> bool:
 
 def generate_default_object_key() -> str:
     """
-    Generates a default object key with timestamp.
+    Generates a default object key with a UTC timestamp.
 
     Returns:
         str: Object key with format uploads/file-YYYYMMDD-HHMMSS
     """
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    timestamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
     return f"uploads/file-{timestamp}"
 
 
@@ -92,7 +379,8 @@ def generate_presigned_url(
     bucket_name: str,
     object_key: str,
     expiration: int = 3600,
-    content_type: Optional[str] = None
+    content_type: Optional[str] = None,
+    region: Optional[str] = None
 ) -> Optional[str]:
     """
     Generates a presigned URL to upload an object to S3.
@@ -102,32 +390,230 @@ def generate_presigned_url(
         object_key: Object key/path in S3
         expiration: Validity duration in seconds (default: 3600)
         content_type: File MIME type (optional)
+        region: Bucket region (optional, looked up and cached otherwise)
 
     Returns:
         Optional[str]: Presigned URL or None on error
     """
-    try:
-        s3_client = boto3.client('s3')
-
-        # Prepare parameters
-        params = {
-            'Bucket': bucket_name,
-            'Key': object_key
-        }
-
-        # Add Content-Type if specified
-        if content_type:
-            params['ContentType'] = content_type
-
-        # Generate presigned URL for PUT
-        presigned_url = s3_client.generate_presigned_url(
-            'put_object',
-            Params=params,
-            ExpiresIn=expiration
-        )
+    presigned_urls = generate_presigned_urls(
+        bucket_name,
+        [object_key],
+        expiration,
+        content_type,
+        region
+    )
+    return presigned_urls[0].url if presigned_urls else None
+
+
+@functools.lru_cache(maxsize=8)
+def _signing_key(secret_key: str, date_stamp: str, region: str, service: str) -> bytes:
+    """Derives the SigV4 signing key, which only changes with the date, region or credentials"""
+    signing_key = ('AWS4' + secret_key).encode()
+    for part in (date_stamp, region, service, 'aws4_request'):
+        signing_key = hmac.new(signing_key, part.encode(), hashlib.sha256).digest()
+    return signing_key
 
-        return presigned_url
 
+def put_url_signer(
+    credentials,
+    region: str,
+    bucket_name: str,
+    expiration: int = 3600,
+    content_type: Optional[str] = None,
+    now: Optional[datetime] = None
+) -> Callable[[str], str]:
+    """
+    Builds a SigV4 presigned PUT URL signer for one bucket and batch.
+
+    Everything but the object path is the same for every key of a batch:
+    the query string, canonical headers, credential scope and signing key
+    are computed here once, leaving one SHA-256 and one HMAC per key.
+    Produces the same URLs as botocore's generate_presigned_url for a
+    virtual-hosted regional client.
+
+    Args:
+        credentials: Frozen AWS credentials (access_key, secret_key, token)
+        region: Bucket region
+        bucket_name: S3 bucket name
+        expiration: Validity duration in seconds (default: 3600)
+        content_type: File MIME type the upload must use (optional)
+        now: Signing time (default: current UTC time)
+
+    Returns:
+        Callable[[str], str]: Function mapping an object key to its URL
+    """
+    now = now or datetime.now(timezone.utc)
+    amz_date = now.strftime('%Y%m%dT%H%M%SZ')
+    date_stamp = amz_date[:8]
+    credential_scope = f"{date_stamp}/{region}/s3/aws4_request"
+
+    # Dotted bucket names don't match the wildcard TLS certificate
+    if '.' in bucket_name:
+        host = f"s3.{region}.amazonaws.com"
+        path_prefix = f"/{bucket_name}/"
+    else:
+        host = f"{bucket_name}.s3.{region}.amazonaws.com"
+        path_prefix = '/'
+
+    headers = {'host': host}
+    if content_type:
+        headers['content-type'] = ' '.join(content_type.split())
+    signed_headers = ';'.join(sorted(headers))
+
+    query = [
+        ('X-Amz-Algorithm', 'AWS4-HMAC-SHA256'),
+        ('X-Amz-Credential', f"{credentials.access_key}/{credential_scope}"),
+        ('X-Amz-Date', amz_date),
+        ('X-Amz-Expires', str(expiration)),
+        ('X-Amz-SignedHeaders', signed_headers)
+    ]
+    if credentials.token:
+        query.append(('X-Amz-Security-Token', credentials.token))
+    query = [(quote(name, safe='-_.~'), quote(value, safe='-_.~')) for name, value in query]
+    query_string = '&'.join(f"{name}={value}" for name, value in query)
+
+    # Canonical request: PUT, path, then this constant suffix
+    canonical_suffix = '\n'.join([
+        '&'.join(f"{name}={value}" for name, value in sorted(query)),
+        ''.join(f"{name}:{headers[name]}\n" for name in sorted(headers)),
+        signed_headers,
+        'UNSIGNED-PAYLOAD'
+    ])
+    string_to_sign_prefix = f"AWS4-HMAC-SHA256\n{amz_date}\n{credential_scope}\n"
+    signing_key = _signing_key(credentials.secret_key, date_stamp, region, 's3')
+
+    # Hash and HMAC states primed with the constant leading parts, so a
+    # key only costs copying them and feeding in what follows
+    canonical_head = hashlib.sha256(f"PUT\n{path_prefix}".encode())
+    canonical_tail = f"\n{canonical_suffix}".encode()
+    signature_head = hmac.new(signing_key, string_to_sign_prefix.encode(), hashlib.sha256)
+    url_head = f"https://{host}{path_prefix}"
+    url_tail = f"?{query_string}&X-Amz-Signature="
+
+    # Plain locals for the per-key path: no global or attribute lookups
+    _quote = quote
+    _copy_canonical = canonical_head.copy
+    _copy_signature = signature_head.copy
+
+    def sign(object_key: str) -> str:
+        quoted_key = _quote(object_key, safe='/~')
+        canonical_hash = _copy_canonical()
+        canonical_hash.update(quoted_key.encode())
+        canonical_hash.update(canonical_tail)
+        signature = _copy_signature()
+        signature.update(canonical_hash.hexdigest().encode())
+        return url_head + quoted_key + url_tail + signature.hexdigest()
+
+    return sign
+
+
+def presign_put_url(
+    credentials,
+    region: str,
+    bucket_name: str,
+    object_key: str,
+    expiration: int = 3600,
+    content_type: Optional[str] = None,
+    now: Optional[datetime] = None
+) -> str:
+    """
+    Computes a single SigV4 presigned PUT URL (see put_url_signer).
+
+    Args:
+        credentials: Frozen AWS credentials (access_key, secret_key, token)
+        region: Bucket region
+        bucket_name: S3 bucket name
+        object_key: Object key/path in S3
+        expiration: Validity duration in seconds (default: 3600)
+        content_type: File MIME type the upload must use (optional)
+        now: Signing time (default: current UTC time)
+
+    Returns:
+        str: Presigned URL
+    """
+    return put_url_signer(credentials, region, bucket_name, expiration, content_type, now)(object_key)
+
+
+def generate_presigned_urls(
+    bucket_name: str,
+    object_keys: List[str],
+    expiration: int = 3600,
+    content_type: Optional[str] = None,
+    region: Optional[str] = None,
+    cache_dir: Optional[str] = None
+) -> Optional[List[PresignedUrl]]:
+    """
+    Generates presigned URLs to upload several objects to S3.
+
+    Credentials and region are resolved once for all keys, which are
+    then signed locally (see put_url_signer). Signing is pure Python and
+    holds the GIL, so it runs in a plain loop rather than a thread pool.
+
+    With a cache directory, a URL signed by an earlier run for the same
+    bucket, key, content type, credentials, expiration and region is
+    returned again while more than max(5 minutes, 10% of the expiration)
+    of its validity remains, so downstream HTTP caches keep hitting.
+    Such a URL keeps its original, shorter expiry, reported in expires_at.
+
+    Args:
+        bucket_name: S3 bucket name
+        object_keys: Object keys/paths in S3
+        expiration: Validity duration in seconds (default: 3600)
+        content_type: File MIME type (optional)
+        region: Bucket region (optional, looked up and cached otherwise)
+        cache_dir: Presigned URL cache directory (optional, no caching otherwise)
+
+    Returns:
+        Optional[List[PresignedUrl]]: Presigned URLs in key order or None on error
+    """
+    _boto()
+    from botocore.exceptions import ClientError, NoCredentialsError
+
+    try:
+        credentials = _session().get_credentials()
+        if credentials is None:
+            raise NoCredentialsError()
+        credentials = credentials.get_frozen_credentials()
+        region = region or get_bucket_region(bucket_name) or _session().region_name or 'us-east-1'
+        signed_at = datetime.now(timezone.utc)
+        sign_one = put_url_signer(credentials, region, bucket_name, expiration, content_type, signed_at)
+
+        signed_at_epoch = signed_at.timestamp()
+        expires_at = int(signed_at_epoch) + expiration
+
+        if cache_dir is None:
+            return [
+                PresignedUrl(sign_one(object_key), expires_at, False)
+                for object_key in object_keys
+            ]
+
+        cache_paths = [
+            _url_cache_path(
+                cache_dir,
+                bucket_name,
+                object_key,
+                content_type or '',
+                credentials.access_key,
+                str(expiration),
+                region
+            )
+            for object_key in object_keys
+        ]
+        valid_until = signed_at_epoch + max(URL_CACHE_MIN_REMAINING, expiration * 0.1)
+        presigned_urls = [_read_cached_url(cache_path, valid_until) for cache_path in cache_paths]
+
+        missing = [i for i, presigned_url in enumerate(presigned_urls) if presigned_url is None]
+        if missing:
+            _prune_url_cache(cache_dir, signed_at_epoch)
+        for i in missing:
+            presigned_urls[i] = PresignedUrl(sign_one(object_keys[i]), expires_at, False)
+            _write_cached_url(cache_paths[i], presigned_urls[i])
+        return presigned_urls
+
+    except NoCredentialsError:
+        # Run the full verification only now, for its explanatory message
+        check_aws_credentials()
+        return None
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
         error_message = e.response.get('Error', {}).get('Message', str(e))
@@ -138,55 +624,138 @@ def generate_presigned_url(
         return None
 
 
-def print_usage_examples(presigned_url: str, expiration: int) -> None:
+def _plural(count: int, unit: str) -> str:
+    """Formats a count with its unit, pluralized above one (e.g. "2 hours")."""
+    return f"{count} {unit}{'s' if count > 1 else ''}"
+
+
+def format_duration(expiration: int) -> str:
     """
-    Displays usage examples for the presigned URL.
+    Converts a duration in seconds to a readable format.
 
     Args:
-        presigned_url: The generated presigned URL
-        expiration: Validity duration in seconds
-    """
-    print()
-    print("━" * 70)
-    print_success("PRESIGNED URL:")
-    print(presigned_url)
-    print("━" * 70)
-    print()
-
-    print_warning("To upload a file with this URL, use:")
-    print()
-    print("  With curl:")
-    print(f'  curl -X PUT -T "path/to/file" "{presigned_url}"')
-    print()
-    print("  With wget:")
-    print(f'  wget --method=PUT --body-file="path/to/file" "{presigned_url}"')
-    print()
-    print("  With Python requests:")
-    print("  import requests")
-    print("  with open('file', 'rb') as f:")
-    print(f"      response = requests.put('{presigned_url[:50]}...', data=f)")
-    print()
-
-    # Convert duration to readable format
-    hours = expiration // 3600
-    minutes = (expiration % 3600) // 60
-    seconds = expiration % 60
+        expiration: Duration in seconds
+
+    Returns:
+        str: Readable duration (e.g. "1 hour 30 minutes")
+    """
+    hours, remainder = divmod(expiration, 3600)
+    minutes, seconds = divmod(remainder, 60)
 
     duration_parts = []
     if hours > 0:
-        duration_parts.append(f"{hours} hour{'s' if hours > 1 else ''}")
+        duration_parts.append(_plural(hours, 'hour'))
     if minutes > 0:
-        duration_parts.append(f"{minutes} minute{'s' if minutes > 1 else ''}")
+        duration_parts.append(_plural(minutes, 'minute'))
     if seconds > 0 or not duration_parts:
-        duration_parts.append(f"{seconds} second{'s' if seconds > 1 else ''}")
+        duration_parts.append(_plural(seconds, 'second'))
 
-    duration_str = " ".join(duration_parts)
-    print_warning(f"The URL expires in {duration_str}")
-    print()
+    return " ".join(duration_parts)
 
 
-def main():
-    """Main script function."""
+def read_object_keys(path: str) -> List[str]:
+    """
+    Reads newline-delimited object keys from a file.
+
+    Only the line terminator is removed: S3 keys may start or end with
+    spaces, which must be signed as they are.
+
+    Args:
+        path: File path, or "-" for stdin
+
+    Returns:
+        List[str]: Object keys, blank lines skipped
+    """
+    if path == '-':
+        return _parse_object_keys(sys.stdin)
+    with open(path) as f:
+        return _parse_object_keys(f)
+
+
+def _parse_object_keys(lines: TextIO) -> List[str]:
+    """Strips line terminators and skips blank lines."""
+    object_keys = []
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line.strip():
+            object_keys.append(line)
+    return object_keys
+
+
+def print_usage_examples(presigned_url: str, expires_in: int) -> None:
+    """
+    Displays usage examples for the presigned URL.
+
+    Args:
+        presigned_url: The generated presigned URL
+        expires_in: Remaining validity in seconds
+    """
+    green, yellow, nc = Colors.GREEN, Colors.YELLOW, Colors.NC
+
+    # Build the whole block first and write it in one call
+    out = []
+    out.append("\n")
+    out.append("━" * 70 + "\n")
+    out.append(f"{green}PRESIGNED URL:{nc}\n")
+    out.append(f"{presigned_url}\n")
+    out.append("━" * 70 + "\n")
+    out.append("\n")
+
+    out.append(f"{yellow}To upload a file with this URL, use:{nc}\n")
+    out.append("\n")
+    out.append("  With curl:\n")
+    out.append(f'  curl -X PUT -T "path/to/file" "{presigned_url}"\n')
+    out.append("\n")
+    out.append("  With wget:\n")
+    out.append(f'  wget --method=PUT --body-file="path/to/file" "{presigned_url}"\n')
+    out.append("\n")
+    out.append("  With Python requests:\n")
+    out.append("  import requests\n")
+    out.append("  with open('file', 'rb') as f:\n")
+    out.append(f"      response = requests.put('{presigned_url[:50]}...', data=f)\n")
+    out.append("\n")
+
+    out.append(f"{yellow}The URL expires in {format_duration(expires_in)}{nc}\n")
+    out.append("\n")
+
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
+
+
+def print_url_list(object_keys: List[str], presigned_urls: List[str], expires_in: List[int]) -> None:
+    """
+    Displays the presigned URLs generated for several objects.
+
+    Args:
+        object_keys: Object keys
+        presigned_urls: The generated presigned URLs, in key order
+        expires_in: Remaining validity of each URL in seconds
+    """
+    green, yellow, nc = Colors.GREEN, Colors.YELLOW, Colors.NC
+
+    # Build the whole list first and write it in one call
+    out = ["\n", "━" * 70 + "\n"]
+    for object_key, presigned_url in zip(object_keys, presigned_urls):
+        out.append(f"{green}{object_key}:{nc}\n{presigned_url}\n\n")
+    out.append("━" * 70 + "\n")
+    out.append("\n")
+
+    shortest, longest = min(expires_in), max(expires_in)
+    if shortest == longest:
+        out.append(f"{yellow}The URLs expire in {format_duration(shortest)}{nc}\n")
+    else:
+        out.append(
+            f"{yellow}The URLs expire in {format_duration(shortest)} "
+            f"to {format_duration(longest)}{nc}\n"
+        )
+    out.append("\n")
+
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Builds the command line parser."""
     parser = argparse.ArgumentParser(
         description="Generates an AWS S3 presigned URL for file upload",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -196,6 +765,7 @@ Examples:
   %(prog)s my-bucket --object-key uploads/document.pdf
   %(prog)s my-bucket --object-key uploads/document.pdf --expiration 7200
   %(prog)s my-bucket --object-key image.jpg --content-type image/jpeg
+  %(prog)s my-bucket --object-keys-file keys.txt -q
 
 Prerequisites:
   - Python 3 with boto3 installed (pip3 install boto3)
@@ -211,7 +781,13 @@ Prerequisites:
 
     parser.add_argument(
         '--object-key', '-k',
-        help='Object key/name in S3 (default: uploads/file-YYYYMMDD-HHMMSS)',
+        help='Object key/name in S3 (default: uploads/file-YYYYMMDD-HHMMSS, UTC)',
+        default=None
+    )
+
+    parser.add_argument(
+        '--object-keys-file',
+        help='File with one object key per line ("-" for stdin), one URL per key',
         default=None
     )
 
@@ -228,13 +804,66 @@ Prerequisites:
         default=None
     )
 
+    parser.add_argument(
+        '--region', '-r',
+        help='Bucket region (default: $AWS_REGION, or detected once and cached)',
+        default=os.environ.get('AWS_REGION')
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        help='Reuse the URLs cached in this directory while they stay valid long enough '
+             '(default: no cache, always sign new URLs)',
+        default=None
+    )
+
     parser.add_argument(
         '--quiet', '-q',
         action='store_true',
         help='Quiet mode - displays only the URL'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--verify-credentials', '--verify-creds',
+        action='store_true',
+        help='Verify AWS credentials with STS and display the caller identity'
+    )
+
+    return parser
+
+
+def _default_args(bucket_name: str) -> argparse.Namespace:
+    """
+    Returns the arguments of a plain "<script> <bucket>" call.
+
+    Must match the defaults declared in _build_parser().
+
+    Args:
+        bucket_name: S3 bucket name
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    return argparse.Namespace(
+        bucket_name=bucket_name,
+        object_key=None,
+        object_keys_file=None,
+        expiration=3600,
+        content_type=None,
+        region=os.environ.get('AWS_REGION'),
+        cache_dir=None,
+        quiet=False,
+        verify_credentials=False
+    )
+
+
+def main():
+    """Main script function."""
+    # A bare bucket name is the common call: skip building the parser
+    if len(sys.argv) == 2 and not sys.argv[1].startswith('-'):
+        args = _default_args(sys.argv[1])
+    else:
+        args = _build_parser().parse_args()
 
     # Validate arguments
     if args.expiration < 1:
@@ -242,46 +871,93 @@ Prerequisites:
         sys.exit(1)
 
     if args.expiration > 604800:  # 7 days
-        print_warning("Warning: Maximum recommended expiration is 7 days (604800 seconds)")
-
-    # Generate object key if not provided
-    object_key = args.object_key if args.object_key else generate_default_object_key()
+        print_warning(
+            "Warning: Maximum recommended expiration is 7 days (604800 seconds)",
+            stderr=args.quiet
+        )
 
-    if not args.quiet:
-        print_warning("Checking prerequisites...")
-        print()
+    if args.object_key and args.object_keys_file:
+        print_error("Error: --object-key and --object-keys-file are mutually exclusive")
+        sys.exit(1)
 
-        # Check AWS credentials
-        if not check_aws_credentials():
+    # Read object keys, or generate one if not provided
+    if args.object_keys_file:
+        try:
+            object_keys = read_object_keys(args.object_keys_file)
+        except OSError as e:
+            print_error(f"Error reading object keys: {e}")
+            sys.exit(1)
+        if not object_keys:
+            print_error("Error: No object key found in the keys file")
             sys.exit(1)
+    else:
+        object_keys = [args.object_key if args.object_key else generate_default_object_key()]
 
-        print()
-        print_warning("Generating presigned URL...")
-        print(f"Bucket: {args.bucket_name}")
-        print(f"Object Key: {object_key}")
+    if not args.quiet:
+        # Check AWS credentials (if requested, signing reports missing ones)
+        if args.verify_credentials:
+            print_warning("Checking prerequisites...")
+            print()
+            if not check_aws_credentials():
+                sys.exit(1)
+            print()
+
+        if len(object_keys) == 1:
+            print_warning("Generating presigned URL...")
+            print(f"Bucket: {args.bucket_name}")
+            print(f"Object Key: {object_keys[0]}")
+        else:
+            print_warning(f"Generating {len(object_keys)} presigned URLs...")
+            print(f"Bucket: {args.bucket_name}")
         print(f"Expiration: {args.expiration} seconds")
         if args.content_type:
             print(f"Content-Type: {args.content_type}")
         print()
 
-    # Generate presigned URL
-    presigned_url = generate_presigned_url(
+    # Generate presigned URLs
+    presigned_urls = generate_presigned_urls(
         args.bucket_name,
-        object_key,
+        object_keys,
         args.expiration,
-        args.content_type
+        args.content_type,
+        args.region,
+        args.cache_dir
     )
 
-    if not presigned_url:
+    if not presigned_urls:
         print_error("Failed to generate presigned URL")
         sys.exit(1)
 
     # Display results
     if args.quiet:
-        print(presigned_url)
+        # One write for the whole batch instead of a print per URL
+        sys.stdout.write('\n'.join(presigned.url for presigned in presigned_urls) + '\n')
+        sys.stdout.flush()
+        return
+
+    # Cached URLs keep their original expiry, report what is left of it
+    now = int(time.time())
+    expires_in = [
+        presigned.expires_at - now if presigned.cached else args.expiration
+        for presigned in presigned_urls
+    ]
+    cached_count = sum(presigned.cached for presigned in presigned_urls)
+
+    if len(presigned_urls) == 1:
+        if cached_count:
+            print_success("✓ Presigned URL reused from the cache")
+        else:
+            print_success("✓ Presigned URL generated successfully!")
+        print_usage_examples(presigned_urls[0].url, expires_in[0])
     else:
-        print_success("✓ Presigned URL generated successfully!")
-        print_usage_examples(presigned_url, args.expiration)
+        if cached_count:
+            print_success(
+                f"✓ {len(presigned_urls)} presigned URLs ready "
+                f"({cached_count} reused from the cache)"
+            )
+        else:
+            print_success(f"✓ {len(presigned_urls)} presigned URLs generated successfully!")
+        print_url_list(object_keys, [presigned.url for presigned in presigned_urls], expires_in)
 
 
 if __name__ == '__main__':